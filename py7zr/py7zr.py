@@ -659,6 +659,7 @@ class SevenZipFile(contextlib.AbstractContextManager):
                 else:
                     raise e
         fnames = []  # type: List[str]  # check duplicated filename in one archive?
+        register_filelike = self.worker.register_filelike
         self.q.put(('pre', None, None))
         for f in self.files:
             # TODO: sanity check
@@ -687,7 +688,7 @@ class SevenZipFile(contextlib.AbstractContextManager):
                     # hack for microsoft windows path length limit < 255
                     outfilename = pathlib.WindowsPath('\\\\?\\' + str(outfilename))
             if targets is not None and f.filename not in targets:
-                self.worker.register_filelike(f.id, None)
+                register_filelike(f.id, None)
                 continue
             if f.is_directory:
                 if not outfilename.exists():
@@ -701,7 +702,7 @@ class SevenZipFile(contextlib.AbstractContextManager):
                 fname = outfilename.as_posix()
                 _buf = io.BytesIO()
                 self._dict[fname] = _buf
-                self.worker.register_filelike(f.id, MemIO(_buf))
+                register_filelike(f.id, MemIO(_buf))
             elif f.is_symlink:
                 target_sym.append(outfilename)
                 try:
@@ -710,12 +711,12 @@ class SevenZipFile(contextlib.AbstractContextManager):
                 except OSError as ose:
                     if ose.errno not in [errno.ENOENT]:
                         raise
-                self.worker.register_filelike(f.id, outfilename)
+                register_filelike(f.id, outfilename)
             elif f.is_junction:
                 target_junction.append(outfilename)
-                self.worker.register_filelike(f.id, outfilename)
+                register_filelike(f.id, outfilename)
             else:
-                self.worker.register_filelike(f.id, outfilename)
+                register_filelike(f.id, outfilename)
                 target_files.append((outfilename, f.file_properties()))
         for target_dir in sorted(target_dirs):
             try:
@@ -886,8 +887,7 @@ class SevenZipFile(contextlib.AbstractContextManager):
     def testzip(self) -> Optional[str]:
         self.fp.seek(self.afterheader)
         self.worker = Worker(self.files, self.afterheader, self.header)
-        for f in self.files:
-            self.worker.register_filelike(f.id, None)
+        self.worker.register_filelikes(dict.fromkeys((f.id for f in self.files), None))
         try:
             self.worker.extract(self.fp, parallel=(not self.password_protected))  # TODO: print progress
         except CrcError as crce:
@@ -1138,3 +1138,7 @@ class Worker:
     def register_filelike(self, id: int, fileish: Union[MemIO, pathlib.Path, None]) -> None:
         """register file-ish to worker."""
         self.target_filepath[id] = fileish
+
+    def register_filelikes(self, filelikes: Dict[int, Union[MemIO, pathlib.Path, None]]) -> None:
+        """register file-ish objects to worker at once, keyed by file id."""
+        self.target_filepath.update(filelikes)
@@ -1,9 +1,8 @@
 import asyncio
-import binascii
-import functools
 import hashlib
 import os
 import pathlib
+import sys
 from datetime import datetime, timezone
 
 import py7zr
@@ -12,6 +11,19 @@ testdata_path = os.path.join(os.path.dirname(__file__), 'data')
 os.umask(0o022)
 
 
+def file_sha256(target):
+    with open(str(target), 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # python 3.11 and later
+            return hashlib.file_digest(f, 'sha256').digest()
+        m = hashlib.sha256()
+        buf = memoryview(bytearray(65536))
+        size = f.readinto(buf)
+        while size:
+            m.update(buf[:size])
+            size = f.readinto(buf)
+        return m.digest()
+
+
 def check_output(expected, tmpdir):
     for exp in expected:
         if isinstance(tmpdir, str):
@@ -25,9 +37,7 @@ def check_output(expected, tmpdir):
         if exp.get('mtime', None):
             assert target.stat().st_mtime == exp['mtime'],\
                 "%s, actual: %d, expected: %d" % (exp['filename'], target.stat().st_mtime, exp['mtime'])
-        m = hashlib.sha256()
-        m.update(target.open('rb').read())
-        assert m.digest() == binascii.unhexlify(exp['digest']), "Fails digest for %s" % exp['filename']
+        assert file_sha256(target) == exp['digest'], "Fails digest for %s" % exp['filename']
 
 
 def decode_all(archive, expected, tmpdir):
@@ -39,12 +49,22 @@ def decode_all(archive, expected, tmpdir):
     check_output(expected, tmpdir)
 
 
-async def aio7zr(archive, path):
-    loop = asyncio.get_event_loop()
+def _extract(sevenzip, path):
+    sevenzip.extractall(path=path)
+
+
+def running_loop():
+    """Return the event loop running the calling coroutine."""
+    if sys.version_info >= (3, 7):
+        return asyncio.get_running_loop()
+    return asyncio.get_event_loop()
+
+
+async def aio7zr(archive, path, executor=None):
+    loop = running_loop()
     sevenzip = py7zr.SevenZipFile(archive)
-    partial_py7zr = functools.partial(sevenzip.extractall, path=path)
-    loop.run_in_executor(None, partial_py7zr)
-    loop.run_in_executor(None, sevenzip.close)
+    await loop.run_in_executor(executor, _extract, sevenzip, path)
+    await loop.run_in_executor(executor, sevenzip.close)
 
 
 def ltime(dt_utc):
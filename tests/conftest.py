@@ -1,10 +1,15 @@
 # Configuration for pytest to automatically collect types.
 # Thanks to Guilherme Salgado.
+import concurrent.futures
+import functools
 import os
+import pathlib
 
 import pytest
 from pyannotate_runtime import collect_types
 
+from . import testdata_path
+
 
 def pytest_collection_finish(session):
     """Handle the pytest collection finish hook: configure pyannotate.
@@ -22,6 +27,28 @@ def collect_types_fixture():
     collect_types.stop()
 
 
+@pytest.fixture(scope='session')
+def archive_bytes():
+    """Return a loader of test data contents, which reads each file from disk only once per session."""
+    @functools.lru_cache(maxsize=None)
+    def _read(name: str) -> bytes:
+        return pathlib.Path(testdata_path).joinpath(name).read_bytes()
+    return _read
+
+
+@pytest.fixture(scope='session')
+def extract_pool():
+    """Thread pool shared by tests which run extraction on a worker thread."""
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        yield executor
+
+
 def pytest_sessionfinish(session, exitstatus):
     os.makedirs('build/', exist_ok=True)
-    collect_types.dump_stats("build/type_info.json")
+    # pytest-xdist runs a session per worker; keep each worker from overwriting the others' results.
+    worker = os.environ.get('PYTEST_XDIST_WORKER', None)
+    if worker is not None:
+        collect_types.dump_stats("build/type_info_{}.json".format(worker))
+    elif not session.config.pluginmanager.hasplugin('dsession'):
+        # the xdist controller runs no tests itself, so it has nothing to dump
+        collect_types.dump_stats("build/type_info.json")
@@ -112,11 +112,11 @@ def test_basic_wrong_option_value(tmp_path):
 def test_basic_extract_1(tmp_path):
     archive = py7zr.SevenZipFile(open(os.path.join(testdata_path, 'test_1.7z'), 'rb'))
     expected = [{'filename': 'setup.cfg', 'mode': 33188, 'mtime': 1552522033,
-                 'digest': 'ff77878e070c4ba52732b0c847b5a055a7c454731939c3217db4a7fb4a1e7240'},
+                 'digest': bytes.fromhex('ff77878e070c4ba52732b0c847b5a055a7c454731939c3217db4a7fb4a1e7240')},
                 {'filename': 'setup.py', 'mode': 33188, 'mtime': 1552522141,
-                 'digest': 'b916eed2a4ee4e48c51a2b51d07d450de0be4dbb83d20e67f6fd166ff7921e49'},
+                 'digest': bytes.fromhex('b916eed2a4ee4e48c51a2b51d07d450de0be4dbb83d20e67f6fd166ff7921e49')},
                 {'filename': 'scripts/py7zr', 'mode': 33261, 'mtime': 1552522208,
-                'digest': 'b0385e71d6a07eb692f5fb9798e9d33aaf87be7dfff936fd2473eab2a593d4fd'}
+                'digest': bytes.fromhex('b0385e71d6a07eb692f5fb9798e9d33aaf87be7dfff936fd2473eab2a593d4fd')}
                 ]
     decode_all(archive, expected, tmp_path)
 
@@ -125,7 +125,7 @@ def test_basic_extract_1(tmp_path):
 def test_basic_extract_2(tmp_path):
     archive = py7zr.SevenZipFile(open(os.path.join(testdata_path, 'test_2.7z'), 'rb'))
     expected = [{'filename': 'qt.qt5.597.gcc_64/installscript.qs',
-                 'digest': '39445276e79ea43c0fa8b393b35dc621fcb2045cb82238ddf2b838a4fbf8a587'}]
+                 'digest': bytes.fromhex('39445276e79ea43c0fa8b393b35dc621fcb2045cb82238ddf2b838a4fbf8a587')}]
     decode_all(archive, expected, tmp_path)
 
 
@@ -134,7 +134,7 @@ def test_basic_decode_3(tmp_path):
     """Test when passing path string instead of file-like object."""
     archive = py7zr.SevenZipFile(os.path.join(testdata_path, 'test_1.7z'))
     expected = [{'filename': 'setup.cfg', 'mode': 33188, 'mtime': 1552522033,
-                 'digest': 'ff77878e070c4ba52732b0c847b5a055a7c454731939c3217db4a7fb4a1e7240'}]
+                 'digest': bytes.fromhex('ff77878e070c4ba52732b0c847b5a055a7c454731939c3217db4a7fb4a1e7240')}]
     decode_all(archive, expected, tmp_path)
 
 
@@ -277,11 +277,11 @@ def test_cli_extract(tmp_path):
     cli = py7zr.cli.Cli()
     cli.run(["x", arcfile, str(tmp_path.resolve())])
     expected = [{'filename': 'setup.cfg', 'mode': 33188, 'mtime': 1552522033,
-                 'digest': 'ff77878e070c4ba52732b0c847b5a055a7c454731939c3217db4a7fb4a1e7240'},
+                 'digest': bytes.fromhex('ff77878e070c4ba52732b0c847b5a055a7c454731939c3217db4a7fb4a1e7240')},
                 {'filename': 'setup.py', 'mode': 33188, 'mtime': 1552522141,
-                 'digest': 'b916eed2a4ee4e48c51a2b51d07d450de0be4dbb83d20e67f6fd166ff7921e49'},
+                 'digest': bytes.fromhex('b916eed2a4ee4e48c51a2b51d07d450de0be4dbb83d20e67f6fd166ff7921e49')},
                 {'filename': 'scripts/py7zr', 'mode': 33261, 'mtime': 1552522208,
-                 'digest': 'b0385e71d6a07eb692f5fb9798e9d33aaf87be7dfff936fd2473eab2a593d4fd'}
+                 'digest': bytes.fromhex('b0385e71d6a07eb692f5fb9798e9d33aaf87be7dfff936fd2473eab2a593d4fd')}
                 ]
     check_output(expected, tmp_path)
 
@@ -298,9 +298,9 @@ def test_cli_encrypted_extract(monkeypatch, tmp_path):
     cli = py7zr.cli.Cli()
     cli.run(["x", "--password", arcfile, str(tmp_path.resolve())])
     expected = [{'filename': 'test1.txt', 'mode': 33188,
-                 'digest': '0f16b2f4c3a74b9257cd6229c0b7b91855b3260327ef0a42ecf59c44d065c5b2'},
+                 'digest': bytes.fromhex('0f16b2f4c3a74b9257cd6229c0b7b91855b3260327ef0a42ecf59c44d065c5b2')},
                 {'filename': 'test/test2.txt', 'mode': 33188,
-                 'digest': '1d0d28682fca74c5912ea7e3f6878ccfdb6e4e249b161994b7f2870e6649ef09'}
+                 'digest': bytes.fromhex('1d0d28682fca74c5912ea7e3f6878ccfdb6e4e249b161994b7f2870e6649ef09')}
                 ]
     check_output(expected, tmp_path)
 
@@ -459,7 +459,7 @@ def test_py7zr_writeall_dir(tmp_path):
 def test_py7zr_extract_specified_file(tmp_path):
     archive = py7zr.SevenZipFile(open(os.path.join(testdata_path, 'test_1.7z'), 'rb'))
     expected = [{'filename': 'scripts/py7zr', 'mode': 33261, 'mtime': 1552522208,
-                'digest': 'b0385e71d6a07eb692f5fb9798e9d33aaf87be7dfff936fd2473eab2a593d4fd'}
+                'digest': bytes.fromhex('b0385e71d6a07eb692f5fb9798e9d33aaf87be7dfff936fd2473eab2a593d4fd')}
                 ]
     archive.extract(path=tmp_path, targets=['scripts', 'scripts/py7zr'])
     archive.close()
@@ -71,7 +71,7 @@ def test_concurrent_futures(tmp_path):
 
 
 @pytest.mark.timeout(180)
-def test_concurrent_extraction(tmp_path, caplog):
+def test_concurrent_extraction(tmp_path, caplog, extract_pool):
 
     def extractor(archive, path):
         szf = py7zr.SevenZipFile(archive, 'r')
@@ -83,8 +83,7 @@ def test_concurrent_extraction(tmp_path, caplog):
                 'mblock_3.7z', 'solid.7z', 'symlink.7z', 'test_1.7z', 'test_2.7z',
                 'test_3.7z', 'test_5.7z', 'test_6.7z',
                 'test_folder.7z', 'umlaut-non_solid.7z', 'umlaut-solid.7z', 'zerosize.7z']
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        tasks = [executor.submit(extractor, os.path.join(testdata_path, ar), tmp_path.joinpath(ar)) for ar in archives]
-        done, not_done = concurrent.futures.wait(tasks, return_when=concurrent.futures.ALL_COMPLETED)
-        if len(not_done) > 0:
-            raise Exception("Extraction error.")
+    tasks = [extract_pool.submit(extractor, os.path.join(testdata_path, ar), tmp_path.joinpath(ar)) for ar in archives]
+    done, not_done = concurrent.futures.wait(tasks, return_when=concurrent.futures.ALL_COMPLETED)
+    if len(not_done) > 0:
+        raise Exception("Extraction error.")
@@ -1,7 +1,8 @@
 import asyncio
-import binascii
 import ctypes
 import hashlib
+import io
+import mmap
 import os
 import pathlib
 import shutil
@@ -16,19 +17,48 @@ from py7zr import Bad7zFile, unpack_7zarchive
 from py7zr.exceptions import UnsupportedCompressionMethodError
 from py7zr.helpers import UTC
 
-from . import aio7zr, decode_all
+from . import aio7zr, check_output, file_sha256, running_loop
 
 testdata_path = pathlib.Path(os.path.dirname(__file__)).joinpath('data')
+# archives opened by their path rather than through the archive_bytes fixture
+FILES = {name: os.path.join(str(testdata_path), name)
+         for name in ('crc_corrupted.7z', 'github_14.7z', 'github_14_multi.7z', 'mblock_1.7z', 'test_1.7z', 'test_6.7z')}
+
+_LIBSZIP_DLL_SHA256 = bytes.fromhex('13926e3f080c9ca557165864ce5722acc4f832bb52a92d8d86c7f6e583708c4d')
+_TEST_1_SETUP_CFG_SHA256 = bytes.fromhex('ff77878e070c4ba52732b0c847b5a055a7c454731939c3217db4a7fb4a1e7240')
+_TEST_1_SETUP_PY_SHA256 = bytes.fromhex('b916eed2a4ee4e48c51a2b51d07d450de0be4dbb83d20e67f6fd166ff7921e49')
+_TEST_1_SCRIPT_SHA256 = bytes.fromhex('b0385e71d6a07eb692f5fb9798e9d33aaf87be7dfff936fd2473eab2a593d4fd')
+_7ZDEC_EXE_SHA256 = bytes.fromhex('e14d8201c5c0d1049e717a63898a3b1c7ce4054a24871daebaa717da64dcaff5')
+
+_TEST_ARCHIVE_NAMES = frozenset({'test', 'test/test2.txt', 'test1.txt'})
+_UTC = UTC()
+_TEST2_TXT_DATETIME = datetime(2006, 3, 15, 21, 43, 36, 0, _UTC)
+_TEST1_TXT_DATETIME = datetime(2006, 3, 15, 21, 43, 48, 0, _UTC)
+_UMLAUT_NAMES = frozenset({'t\xe4st.txt'})
+_SYMLINK_NAMES = frozenset({'lib', 'lib/libabc.so', 'lib/libabc.so.1', 'lib/libabc.so.1.2', 'lib/libabc.so.1.2.3', 'lib64'})
+
 os.umask(0o022)
 
 
+def _check_file(path, expected: bytes) -> None:
+    with open(str(path), 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:  # an empty file cannot be mapped
+            assert b'' == expected, "Unexpected contents of %s" % path
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if len(mm) != len(expected) or mm.find(expected) != 0:
+                assert mm[:] == expected, "Unexpected contents of %s" % path
+
+
 def check_archive(archive, tmp_path, return_dict: bool):
-    assert sorted(archive.getnames()) == ['test', 'test/test2.txt', 'test1.txt']
+    names = archive.getnames()
+    assert len(names) == len(_TEST_ARCHIVE_NAMES)
+    assert frozenset(names) == _TEST_ARCHIVE_NAMES
     expected = []
     expected.append({'filename': 'test'})
-    expected.append({'lastwritetime': 12786932616, 'as_datetime': datetime(2006, 3, 15, 21, 43, 36, 0, UTC()),
+    expected.append({'lastwritetime': 12786932616, 'as_datetime': _TEST2_TXT_DATETIME,
                      'filename': 'test/test2.txt'})
-    expected.append({'lastwritetime': 12786932628, 'as_datetime': datetime(2006, 3, 15, 21, 43, 48, 0, UTC()),
+    expected.append({'lastwritetime': 12786932628, 'as_datetime': _TEST1_TXT_DATETIME,
                      'filename': 'test1.txt'})
     for i, cf in enumerate(archive.files):
         assert cf.filename == expected[i]['filename']
@@ -36,304 +66,299 @@ def check_archive(archive, tmp_path, return_dict: bool):
             assert cf.lastwritetime // 10000000 == expected[i]['lastwritetime']
             assert cf.lastwritetime.as_datetime().replace(microsecond=0) == expected[i]['as_datetime']
     if not return_dict:
+        test2 = tmp_path / 'test' / 'test2.txt'
+        test1 = tmp_path / 'test1.txt'
         archive.extractall(path=tmp_path)
-        assert tmp_path.joinpath('test/test2.txt').open('rb').read() == bytes('This file is located in a folder.', 'ascii')
-        assert tmp_path.joinpath('test1.txt').open('rb').read() == bytes('This file is located in the root.', 'ascii')
+        _check_file(test2, b'This file is located in a folder.')
+        _check_file(test1, b'This file is located in the root.')
     else:
         _dict = archive.readall()
         actual = _dict['test/test2.txt'].read()
-        assert actual == bytes('This file is located in a folder.', 'ascii')
+        assert actual == b'This file is located in a folder.'
         actual = _dict['test1.txt'].read()
-        assert actual == bytes('This file is located in the root.', 'ascii')
-    archive.close()
+        assert actual == b'This file is located in the root.'
 
 
 @pytest.mark.files
-def test_solid(tmp_path):
+def test_solid(tmp_path, archive_bytes):
     f = 'solid.7z'
-    archive = py7zr.SevenZipFile(testdata_path.joinpath(f).open(mode='rb'))
-    check_archive(archive, tmp_path, False)
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes(f))) as archive:
+        check_archive(archive, tmp_path, False)
 
 
 @pytest.mark.files
-def test_solid_mem(tmp_path):
+def test_solid_mem(tmp_path, archive_bytes):
     f = 'solid.7z'
-    archive = py7zr.SevenZipFile(testdata_path.joinpath(f).open(mode='rb'))
-    check_archive(archive, tmp_path, True)
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes(f))) as archive:
+        check_archive(archive, tmp_path, True)
 
 
 @pytest.mark.files
-def test_empty():
+def test_empty(archive_bytes):
     # decompress empty archive
-    archive = py7zr.SevenZipFile(testdata_path.joinpath('empty.7z').open(mode='rb'))
-    assert archive.getnames() == []
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('empty.7z'))) as archive:
+        assert archive.getnames() == []
 
 
 @pytest.mark.files
 def test_github_14(tmp_path):
-    archive = py7zr.SevenZipFile(testdata_path.joinpath('github_14.7z').open(mode='rb'))
-    assert archive.getnames() == ['github_14']
-    archive.extractall(path=tmp_path)
-    with tmp_path.joinpath('github_14').open('rb') as f:
-        assert f.read() == bytes('Hello GitHub issue #14.\n', 'ascii')
+    with open(FILES['github_14.7z'], 'rb') as f, py7zr.SevenZipFile(f) as archive:
+        assert archive.getnames() == ['github_14']
+        archive.extractall(path=tmp_path)
+        _check_file(tmp_path.joinpath('github_14'), b'Hello GitHub issue #14.\n')
 
 
 @pytest.mark.files
 def test_github_14_mem(tmp_path):
-    archive = py7zr.SevenZipFile(testdata_path.joinpath('github_14.7z').open(mode='rb'))
-    _dict = archive.readall()
-    actual = _dict['github_14'].read()
-    assert actual == bytes('Hello GitHub issue #14.\n', 'ascii')
+    with open(FILES['github_14.7z'], 'rb') as f, py7zr.SevenZipFile(f) as archive:
+        _dict = archive.readall()
+        actual = _dict['github_14'].read()
+        assert actual == b'Hello GitHub issue #14.\n'
 
 
 @pytest.mark.files
-def _test_umlaut_archive(filename: str, target: pathlib.Path, return_dict: bool):
-    archive = py7zr.SevenZipFile(testdata_path.joinpath(filename).open(mode='rb'))
-    if not return_dict:
-        assert sorted(archive.getnames()) == ['t\xe4st.txt']
-        archive.extractall(path=target)
-        actual = target.joinpath('t\xe4st.txt').open().read()
-        assert actual == 'This file contains a german umlaut in the filename.'
-    else:
-        _dict = archive.readall()
-        actual = _dict['t\xe4st.txt'].read()
-        assert actual == b'This file contains a german umlaut in the filename.'
-    archive.close()
+def _test_umlaut_archive(archive_bytes, filename: str, target: pathlib.Path, return_dict: bool):
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes(filename))) as archive:
+        if not return_dict:
+            names = archive.getnames()
+            assert len(names) == len(_UMLAUT_NAMES)
+            assert frozenset(names) == _UMLAUT_NAMES
+            archive.extractall(path=target)
+            actual = (target / 't\xe4st.txt').read_text()
+            assert actual == 'This file contains a german umlaut in the filename.'
+        else:
+            _dict = archive.readall()
+            actual = _dict['t\xe4st.txt'].read()
+            assert actual == b'This file contains a german umlaut in the filename.'
 
 
 @pytest.mark.files
-def test_non_solid_umlaut(tmp_path):
+def test_non_solid_umlaut(tmp_path, archive_bytes):
     # test loading of a non-solid archive containing files with umlauts
-    _test_umlaut_archive('umlaut-non_solid.7z', tmp_path, False)
+    _test_umlaut_archive(archive_bytes, 'umlaut-non_solid.7z', tmp_path, False)
 
 
 @pytest.mark.files
-def test_non_solid_umlaut_mem(tmp_path):
+def test_non_solid_umlaut_mem(tmp_path, archive_bytes):
     # test loading of a non-solid archive containing files with umlauts
-    _test_umlaut_archive('umlaut-non_solid.7z', tmp_path, True)
+    _test_umlaut_archive(archive_bytes, 'umlaut-non_solid.7z', tmp_path, True)
 
 
 @pytest.mark.files
-def test_solid_umlaut(tmp_path):
+def test_solid_umlaut(tmp_path, archive_bytes):
     # test loading of a solid archive containing files with umlauts
-    _test_umlaut_archive('umlaut-solid.7z', tmp_path, False)
+    _test_umlaut_archive(archive_bytes, 'umlaut-solid.7z', tmp_path, False)
 
 
 @pytest.mark.files
-def test_solid_umlaut_mem(tmp_path):
+def test_solid_umlaut_mem(tmp_path, archive_bytes):
     # test loading of a solid archive containing files with umlauts
-    _test_umlaut_archive('umlaut-solid.7z', tmp_path, True)
+    _test_umlaut_archive(archive_bytes, 'umlaut-solid.7z', tmp_path, True)
+
+
+_BUGZILLA_4_EXPECTED = [{'filename': 'History.txt', 'mtime': 1133704668, 'mode': 33188,
+                         'digest': bytes.fromhex('46b08f0af612371860ab39e3b47666c3bd6fb742c5e8775159310e19ebedae7e')},
+                        {'filename': 'License.txt', 'mtime': 1105356710, 'mode': 33188,
+                         'digest': bytes.fromhex('4f49a4448499449f2864777c895f011fb989836a37990ae1ca532126ca75d25e')},
+                        {'filename': 'copying.txt', 'mtime': 999116366, 'mode': 33188,
+                         'digest': bytes.fromhex('2c3c3ef532828bcd42bb3127349625a25291ff5ae7e6f8d42e0fe9b5be836a99')},
+                        {'filename': 'readme.txt', 'mtime': 1133704646, 'mode': 33188,
+                         'digest': bytes.fromhex('84f2693d9746e919883cf169fc83467be6566d7501b5044693a2480ab36a4899')}]
+
+
+@pytest.fixture(scope='module')
+def bugzilla_4_extracted(archive_bytes, tmp_path_factory):
+    """Parse and extract bugzilla_4.7z once for all of its entry checks."""
+    target = tmp_path_factory.mktemp('bugzilla_4')
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('bugzilla_4.7z'))) as archive:
+        for cf in archive.files:
+            assert cf.lastwritetime is not None
+            assert cf.filename is not None
+        archive.extractall(path=target)
+    return target
 
 
 @pytest.mark.files
-def test_bugzilla_4(tmp_path):
-    archive = py7zr.SevenZipFile(testdata_path.joinpath('bugzilla_4.7z').open(mode='rb'))
-    expected = [{'filename': 'History.txt', 'mtime': 1133704668, 'mode': 33188,
-                 'digest': '46b08f0af612371860ab39e3b47666c3bd6fb742c5e8775159310e19ebedae7e'},
-                {'filename': 'License.txt', 'mtime': 1105356710, 'mode': 33188,
-                 'digest': '4f49a4448499449f2864777c895f011fb989836a37990ae1ca532126ca75d25e'},
-                {'filename': 'copying.txt', 'mtime': 999116366, 'mode': 33188,
-                 'digest': '2c3c3ef532828bcd42bb3127349625a25291ff5ae7e6f8d42e0fe9b5be836a99'},
-                {'filename': 'readme.txt', 'mtime': 1133704646, 'mode': 33188,
-                 'digest': '84f2693d9746e919883cf169fc83467be6566d7501b5044693a2480ab36a4899'}]
-    decode_all(archive, expected, tmp_path)
+@pytest.mark.parametrize('entry', _BUGZILLA_4_EXPECTED, ids=lambda entry: entry['filename'])
+def test_bugzilla_4(bugzilla_4_extracted, entry):
+    check_output([entry], bugzilla_4_extracted)
 
 
 @pytest.mark.files
 @pytest.mark.skipif(sys.platform.startswith("win") and (ctypes.windll.shell32.IsUserAnAdmin() == 0),
                     reason="Administrator rights is required to make symlink on windows")
-def test_extract_symlink(tmp_path):
-    archive = py7zr.SevenZipFile(testdata_path.joinpath('symlink.7z').open(mode='rb'))
-    assert sorted(archive.getnames()) == ['lib', 'lib/libabc.so', 'lib/libabc.so.1', 'lib/libabc.so.1.2',
-                                          'lib/libabc.so.1.2.3', 'lib64']
-    archive.extractall(path=tmp_path)
+def test_extract_symlink(tmp_path, archive_bytes):
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('symlink.7z'))) as archive:
+        names = archive.getnames()
+        assert len(names) == len(_SYMLINK_NAMES)
+        assert frozenset(names) == _SYMLINK_NAMES
+        archive.extractall(path=tmp_path)
 
 
 @pytest.mark.files
-def test_extract_symlink_mem():
-    with py7zr.SevenZipFile(testdata_path.joinpath('symlink.7z').open(mode='rb')) as archive:
+def test_extract_symlink_mem(archive_bytes):
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('symlink.7z'))) as archive:
         _dict = archive.readall()
 
 
 @pytest.mark.files
-def test_lzma2bcj(tmp_path):
+def test_lzma2bcj(tmp_path, archive_bytes):
     """Test extract archive compressed with LZMA2 and BCJ methods."""
-    archive = py7zr.SevenZipFile(testdata_path.joinpath('lzma2bcj.7z').open(mode='rb'))
-    assert archive.getnames() == ['mingw64', 'mingw64/bin', 'mingw64/include', 'mingw64/lib', 'mingw64/share',
-                                  'mingw64/share/doc', 'mingw64/share/doc/szip', 'mingw64/include/SZconfig.h',
-                                  'mingw64/include/ricehdf.h', 'mingw64/include/szip_adpt.h', 'mingw64/include/szlib.h',
-                                  'mingw64/lib/libszip.a', 'mingw64/lib/libszip.dll.a', 'mingw64/share/doc/szip/COPYING',
-                                  'mingw64/share/doc/szip/HISTORY.txt', 'mingw64/share/doc/szip/INSTALL',
-                                  'mingw64/share/doc/szip/README', 'mingw64/share/doc/szip/RELEASE.txt',
-                                  'mingw64/bin/libszip-0.dll']
-    archive.extractall(path=tmp_path)
-    m = hashlib.sha256()
-    m.update(tmp_path.joinpath('mingw64/bin/libszip-0.dll').open('rb').read())
-    assert m.digest() == binascii.unhexlify('13926e3f080c9ca557165864ce5722acc4f832bb52a92d8d86c7f6e583708c4d')
-    archive.close()
-
-
-@pytest.mark.files
-def test_lzma2bcj_mem():
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('lzma2bcj.7z'))) as archive:
+        assert archive.getnames() == ['mingw64', 'mingw64/bin', 'mingw64/include', 'mingw64/lib', 'mingw64/share',
+                                      'mingw64/share/doc', 'mingw64/share/doc/szip', 'mingw64/include/SZconfig.h',
+                                      'mingw64/include/ricehdf.h', 'mingw64/include/szip_adpt.h', 'mingw64/include/szlib.h',
+                                      'mingw64/lib/libszip.a', 'mingw64/lib/libszip.dll.a', 'mingw64/share/doc/szip/COPYING',
+                                      'mingw64/share/doc/szip/HISTORY.txt', 'mingw64/share/doc/szip/INSTALL',
+                                      'mingw64/share/doc/szip/README', 'mingw64/share/doc/szip/RELEASE.txt',
+                                      'mingw64/bin/libszip-0.dll']
+        archive.extractall(path=tmp_path)
+    assert file_sha256(tmp_path / 'mingw64' / 'bin' / 'libszip-0.dll') == _LIBSZIP_DLL_SHA256
+
+
+@pytest.mark.files
+def test_lzma2bcj_mem(archive_bytes):
     """Test extract archive compressed with LZMA2 and BCJ methods."""
-    archive = py7zr.SevenZipFile(testdata_path.joinpath('lzma2bcj.7z').open(mode='rb'))
-    assert archive.getnames() == ['mingw64', 'mingw64/bin', 'mingw64/include', 'mingw64/lib', 'mingw64/share',
-                                  'mingw64/share/doc', 'mingw64/share/doc/szip', 'mingw64/include/SZconfig.h',
-                                  'mingw64/include/ricehdf.h', 'mingw64/include/szip_adpt.h', 'mingw64/include/szlib.h',
-                                  'mingw64/lib/libszip.a', 'mingw64/lib/libszip.dll.a', 'mingw64/share/doc/szip/COPYING',
-                                  'mingw64/share/doc/szip/HISTORY.txt', 'mingw64/share/doc/szip/INSTALL',
-                                  'mingw64/share/doc/szip/README', 'mingw64/share/doc/szip/RELEASE.txt',
-                                  'mingw64/bin/libszip-0.dll']
-    _dict = archive.readall()
-    m = hashlib.sha256()
-    m.update(_dict['mingw64/bin/libszip-0.dll'].read())
-    assert m.digest() == binascii.unhexlify('13926e3f080c9ca557165864ce5722acc4f832bb52a92d8d86c7f6e583708c4d')
-    archive.close()
-
-
-@pytest.mark.files
-def test_lzma2bcj2(tmp_path):
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('lzma2bcj.7z'))) as archive:
+        assert archive.getnames() == ['mingw64', 'mingw64/bin', 'mingw64/include', 'mingw64/lib', 'mingw64/share',
+                                      'mingw64/share/doc', 'mingw64/share/doc/szip', 'mingw64/include/SZconfig.h',
+                                      'mingw64/include/ricehdf.h', 'mingw64/include/szip_adpt.h', 'mingw64/include/szlib.h',
+                                      'mingw64/lib/libszip.a', 'mingw64/lib/libszip.dll.a', 'mingw64/share/doc/szip/COPYING',
+                                      'mingw64/share/doc/szip/HISTORY.txt', 'mingw64/share/doc/szip/INSTALL',
+                                      'mingw64/share/doc/szip/README', 'mingw64/share/doc/szip/RELEASE.txt',
+                                      'mingw64/bin/libszip-0.dll']
+        _dict = archive.readall()
+        m = hashlib.sha256()
+        m.update(_dict['mingw64/bin/libszip-0.dll'].read())
+        assert m.digest() == _LIBSZIP_DLL_SHA256
+
+
+@pytest.mark.files
+def test_lzma2bcj2(tmp_path, archive_bytes):
     """Test extract archive compressed with LZMA2 and BCJ2 methods."""
     with pytest.raises(UnsupportedCompressionMethodError):
-        archive = py7zr.SevenZipFile(testdata_path.joinpath('lzma2bcj2.7z').open(mode='rb'))
-        archive.extractall(path=tmp_path)
-        archive.close()
+        with py7zr.SevenZipFile(io.BytesIO(archive_bytes('lzma2bcj2.7z'))) as archive:
+            archive.extractall(path=tmp_path)
 
 
 @pytest.mark.files
-def test_extract_lzma_1(tmp_path):
-    with py7zr.SevenZipFile(testdata_path.joinpath('lzma_1.7z').open(mode='rb')) as ar:
+def test_extract_lzma_1(tmp_path, archive_bytes):
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('lzma_1.7z'))) as ar:
         ar.extractall(tmp_path)
 
 
 @pytest.mark.files
-def test_extract_lzma2_1(tmp_path):
-    with py7zr.SevenZipFile(testdata_path.joinpath('lzma2_1.7z').open(mode='rb')) as ar:
+def test_extract_lzma2_1(tmp_path, archive_bytes):
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('lzma2_1.7z'))) as ar:
         _dict = ar.readall()
 
 
 @pytest.mark.files
-def test_zerosize(tmp_path):
-    archive = py7zr.SevenZipFile(testdata_path.joinpath('zerosize.7z').open(mode='rb'))
-    archive.extractall(path=tmp_path)
-    archive.close()
+def test_zerosize(tmp_path, archive_bytes):
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('zerosize.7z'))) as archive:
+        archive.extractall(path=tmp_path)
 
 
 @pytest.mark.files
-def test_zerosize_mem():
-    archive = py7zr.SevenZipFile(testdata_path.joinpath('zerosize.7z').open(mode='rb'))
-    _dict = archive.readall()
-    archive.close()
+def test_zerosize_mem(archive_bytes):
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('zerosize.7z'))) as archive:
+        _dict = archive.readall()
 
 
 @pytest.mark.api
 def test_register_unpack_archive(tmp_path):
     shutil.register_unpack_format('7zip', ['.7z'], unpack_7zarchive)
-    shutil.unpack_archive(str(testdata_path.joinpath('test_1.7z')), str(tmp_path))
+    shutil.unpack_archive(FILES['test_1.7z'], str(tmp_path))
     target = tmp_path.joinpath("setup.cfg")
     expected_mode = 33188
     expected_mtime = 1552522033
     if os.name == 'posix':
         assert target.stat().st_mode == expected_mode
     assert target.stat().st_mtime == expected_mtime
-    m = hashlib.sha256()
-    m.update(target.open('rb').read())
-    assert m.digest() == binascii.unhexlify('ff77878e070c4ba52732b0c847b5a055a7c454731939c3217db4a7fb4a1e7240')
-    m = hashlib.sha256()
-    m.update(tmp_path.joinpath('setup.py').open('rb').read())
-    assert m.digest() == binascii.unhexlify('b916eed2a4ee4e48c51a2b51d07d450de0be4dbb83d20e67f6fd166ff7921e49')
-    m = hashlib.sha256()
-    m.update(tmp_path.joinpath('scripts/py7zr').open('rb').read())
-    assert m.digest() == binascii.unhexlify('b0385e71d6a07eb692f5fb9798e9d33aaf87be7dfff936fd2473eab2a593d4fd')
+    for path, digest in ((target, _TEST_1_SETUP_CFG_SHA256),
+                         (tmp_path.joinpath('setup.py'), _TEST_1_SETUP_PY_SHA256),
+                         (tmp_path.joinpath('scripts/py7zr'), _TEST_1_SCRIPT_SHA256)):
+        assert file_sha256(path) == digest, "Fails digest for %s" % path
 
 
 @pytest.mark.files
-def test_skip():
-    archive = py7zr.SevenZipFile(testdata_path.joinpath('test_1.7z').open(mode='rb'))
-    for i, cf in enumerate(archive.files):
-        assert cf is not None
-        archive.worker.register_filelike(cf.id, None)
-    archive.worker.extract(archive.fp, parallel=True)
-    archive.close()
+def test_skip(archive_bytes):
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('test_1.7z'))) as archive:
+        for cf in archive.files:
+            assert cf is not None
+        archive.worker.register_filelikes({cf.id: None for cf in archive.files})
+        archive.worker.extract(archive.fp, parallel=True)
 
 
 @pytest.mark.files
 def test_github_14_multi(tmp_path):
     """ multiple unnamed objects."""
-    archive = py7zr.SevenZipFile(str(testdata_path.joinpath('github_14_multi.7z')), 'r')
-    assert archive.getnames() == ['github_14_multi', 'github_14_multi']
-    archive.extractall(path=tmp_path)
-    with tmp_path.joinpath('github_14_multi').open('rb') as f:
-        assert f.read() == bytes('Hello GitHub issue #14 1/2.\n', 'ascii')
-    with tmp_path.joinpath('github_14_multi_0').open('rb') as f:
-        assert f.read() == bytes('Hello GitHub issue #14 2/2.\n', 'ascii')
-    archive.close()
+    with py7zr.SevenZipFile(FILES['github_14_multi.7z'], 'r') as archive:
+        assert archive.getnames() == ['github_14_multi', 'github_14_multi']
+        archive.extractall(path=tmp_path)
+        _check_file(tmp_path.joinpath('github_14_multi'), b'Hello GitHub issue #14 1/2.\n')
+        _check_file(tmp_path.joinpath('github_14_multi_0'), b'Hello GitHub issue #14 2/2.\n')
 
 
 @pytest.mark.files
 def test_github_14_multi_mem():
     """ multiple unnamed objects."""
-    archive = py7zr.SevenZipFile(str(testdata_path.joinpath('github_14_multi.7z')), 'r')
-    assert archive.getnames() == ['github_14_multi', 'github_14_multi']
-    _dict = archive.readall()
-    actual_1 = _dict['github_14_multi'].read()
-    assert actual_1 == bytes('Hello GitHub issue #14 1/2.\n', 'ascii')
-    actual_2 = _dict['github_14_multi_0'].read()
-    assert actual_2 == bytes('Hello GitHub issue #14 2/2.\n', 'ascii')
-    archive.close()
+    with py7zr.SevenZipFile(FILES['github_14_multi.7z'], 'r') as archive:
+        assert archive.getnames() == ['github_14_multi', 'github_14_multi']
+        _dict = archive.readall()
+        actual_1 = _dict['github_14_multi'].read()
+        assert actual_1 == b'Hello GitHub issue #14 1/2.\n'
+        actual_2 = _dict['github_14_multi_0'].read()
+        assert actual_2 == b'Hello GitHub issue #14 2/2.\n'
 
 
 @pytest.mark.files
-def test_multiblock(tmp_path):
-    archive = py7zr.SevenZipFile(testdata_path.joinpath('mblock_1.7z').open(mode='rb'))
-    archive.extractall(path=tmp_path)
-    m = hashlib.sha256()
-    m.update(tmp_path.joinpath('bin/7zdec.exe').open('rb').read())
-    assert m.digest() == binascii.unhexlify('e14d8201c5c0d1049e717a63898a3b1c7ce4054a24871daebaa717da64dcaff5')
-    archive.close()
+def test_multiblock(tmp_path, archive_bytes):
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('mblock_1.7z'))) as archive:
+        archive.extractall(path=tmp_path)
+    assert file_sha256(tmp_path / 'bin' / '7zdec.exe') == _7ZDEC_EXE_SHA256
 
 
 @pytest.mark.files
-def test_multiblock_mem():
-    archive = py7zr.SevenZipFile(testdata_path.joinpath('mblock_1.7z').open(mode='rb'))
-    _dict = archive.readall()
-    m = hashlib.sha256()
-    m.update(_dict["bin/7zdec.exe"].read())
-    assert m.digest() == binascii.unhexlify('e14d8201c5c0d1049e717a63898a3b1c7ce4054a24871daebaa717da64dcaff5')
-    archive.close()
+def test_multiblock_mem(archive_bytes):
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('mblock_1.7z'))) as archive:
+        _dict = archive.readall()
+        m = hashlib.sha256()
+        m.update(_dict["bin/7zdec.exe"].read())
+        assert m.digest() == _7ZDEC_EXE_SHA256
 
 
 @pytest.mark.files
 @pytest.mark.skipif(sys.platform.startswith('win'), reason="Cannot unlink opened file on Windows")
 def test_multiblock_unlink(tmp_path):
     """When passing opened file object, even after unlink it should work."""
-    shutil.copy(str(testdata_path.joinpath('mblock_1.7z')), str(tmp_path))
+    shutil.copy(FILES['mblock_1.7z'], str(tmp_path))
     src = tmp_path.joinpath('mblock_1.7z')
-    archive = py7zr.SevenZipFile(open(str(src), 'rb'))
-    os.unlink(str(src))
-    archive.extractall(path=tmp_path)
-    archive.close()
+    with open(str(src), 'rb') as f, py7zr.SevenZipFile(f) as archive:
+        os.unlink(str(src))
+        archive.extractall(path=tmp_path)
+    assert file_sha256(tmp_path / 'bin' / '7zdec.exe') == _7ZDEC_EXE_SHA256
 
 
 @pytest.mark.files
-def test_copy(tmp_path):
+def test_copy(tmp_path, archive_bytes):
     """ test loading of copy compressed files.(help wanted)"""
-    check_archive(py7zr.SevenZipFile(testdata_path.joinpath('copy.7z').open(mode='rb')), tmp_path, False)
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('copy.7z'))) as archive:
+        check_archive(archive, tmp_path, False)
 
 
 @pytest.mark.files
-def test_copy_2(tmp_path):
+def test_copy_2(tmp_path, archive_bytes):
     """ test loading of copy compressed files part2."""
-    with py7zr.SevenZipFile(testdata_path.joinpath('copy_2.7z').open(mode='rb')) as ar:
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('copy_2.7z'))) as ar:
         ar.extractall(path=tmp_path)
 
 
 @pytest.mark.files
 def test_close_unlink(tmp_path):
-    shutil.copyfile(str(testdata_path.joinpath('test_1.7z')), str(tmp_path.joinpath('test_1.7z')))
-    archive = py7zr.SevenZipFile(str(tmp_path.joinpath('test_1.7z')))
-    archive.extractall(path=str(tmp_path))
-    archive.close()
+    shutil.copyfile(FILES['test_1.7z'], str(tmp_path.joinpath('test_1.7z')))
+    with py7zr.SevenZipFile(str(tmp_path.joinpath('test_1.7z'))) as archive:
+        archive.extractall(path=str(tmp_path))
     tmp_path.joinpath('test_1.7z').unlink()
 
 
@@ -341,65 +366,72 @@ def test_close_unlink(tmp_path):
 @pytest.mark.asyncio
 @pytest.mark.skipif(sys.version_info < (3, 6), reason="requires python3.6 or higher")
 @pytest.mark.skipif(hasattr(sys, 'pypy_version_info'), reason="Not working with pypy3")
-def test_asyncio_executor(tmp_path):
-    shutil.copyfile(os.path.join(testdata_path, 'test_1.7z'), str(tmp_path.joinpath('test_1.7z')))
-    loop = asyncio.get_event_loop()
-    task = asyncio.ensure_future(aio7zr(tmp_path.joinpath('test_1.7z'), path=tmp_path))
-    loop.run_until_complete(task)
-    loop.run_until_complete(asyncio.sleep(3))
-    os.unlink(str(tmp_path.joinpath('test_1.7z')))
+def test_asyncio_executor(tmp_path, extract_pool):
+    src = tmp_path.joinpath('test_1.7z')
+    shutil.copyfile(FILES['test_1.7z'], str(src))
+
+    async def main():
+        await aio7zr(src, path=tmp_path, executor=extract_pool)
+        await running_loop().run_in_executor(extract_pool, os.unlink, str(src))
+
+    if sys.version_info >= (3, 7):
+        asyncio.run(main())
+    else:
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(main())
+        finally:
+            loop.close()
+    assert tmp_path.joinpath('setup.py').exists()
+    assert not src.exists()
 
 
 @pytest.mark.files
-def test_no_main_streams(tmp_path):
-    archive = py7zr.SevenZipFile(testdata_path.joinpath('test_folder.7z').open(mode='rb'))
-    archive.extractall(path=tmp_path)
-    archive.close()
+def test_no_main_streams(tmp_path, archive_bytes):
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('test_folder.7z'))) as archive:
+        archive.extractall(path=tmp_path)
 
 
 @pytest.mark.files
-def test_no_main_streams_mem():
-    archive = py7zr.SevenZipFile(testdata_path.joinpath('test_folder.7z').open(mode='rb'))
-    _dict = archive.readall()
-    archive.close()
+def test_no_main_streams_mem(archive_bytes):
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('test_folder.7z'))) as archive:
+        _dict = archive.readall()
 
 
 @pytest.mark.files
 @pytest.mark.skipif(sys.platform.startswith("win") and (ctypes.windll.shell32.IsUserAnAdmin() == 0),
                     reason="Administrator rights is required to make symlink on windows")
-def test_extract_symlink_with_relative_target_path(tmp_path):
-    archive = py7zr.SevenZipFile(testdata_path.joinpath('symlink.7z').open(mode='rb'))
-    os.chdir(str(tmp_path))
-    os.makedirs(str(tmp_path.joinpath('target')))  # py35 need str() against pathlib.Path
-    archive.extractall(path='target')
-    assert os.readlink(str(tmp_path.joinpath('target/lib/libabc.so.1.2'))) == 'libabc.so.1.2.3'
-    archive.close()
+def test_extract_symlink_with_relative_target_path(tmp_path, archive_bytes):
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('symlink.7z'))) as archive:
+        os.chdir(str(tmp_path))
+        os.makedirs(str(tmp_path.joinpath('target')))  # py35 need str() against pathlib.Path
+        archive.extractall(path='target')
+        assert os.readlink(str(tmp_path.joinpath('target/lib/libabc.so.1.2'))) == 'libabc.so.1.2.3'
 
 
 @pytest.mark.files
 @pytest.mark.skipif(sys.platform.startswith("win") and (ctypes.windll.shell32.IsUserAnAdmin() == 0),
                     reason="Administrator rights is required to make symlink on windows")
 def test_extract_emptystream_mix(tmp_path):
-    archive = py7zr.SevenZipFile(str(testdata_path.joinpath('test_6.7z')), 'r')
-    archive.extractall(path=tmp_path)
-    archive.close()
+    with py7zr.SevenZipFile(FILES['test_6.7z'], 'r') as archive:
+        archive.extractall(path=tmp_path)
 
 
 @pytest.mark.files
-def test_extract_longpath_file(tmp_path):
-    with py7zr.SevenZipFile(testdata_path.joinpath('longpath.7z').open('rb')) as archive:
+def test_extract_longpath_file(tmp_path, archive_bytes):
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('longpath.7z'))) as archive:
         archive.extractall(path=tmp_path)
 
 
 @pytest.mark.files
 @pytest.mark.skipif(sys.platform.startswith("win") and (ctypes.windll.shell32.IsUserAnAdmin() == 0),
                     reason="Administrator rights is required to make symlink on windows")
-def test_extract_symlink_overwrite(tmp_path):
+def test_extract_symlink_overwrite(tmp_path, archive_bytes):
     os.chdir(str(tmp_path))
     os.makedirs(str(tmp_path.joinpath('target')))  # py35 need str() against pathlib.Path
-    with py7zr.SevenZipFile(testdata_path.joinpath('symlink.7z').open(mode='rb')) as archive:
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('symlink.7z'))) as archive:
         archive.extractall(path='target')
-    with py7zr.SevenZipFile(testdata_path.joinpath('symlink.7z').open(mode='rb')) as archive:
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('symlink.7z'))) as archive:
         archive.extractall(path='target')
     assert os.readlink(str(tmp_path.joinpath('target/lib/libabc.so.1.2'))) == 'libabc.so.1.2.3'
 
@@ -407,14 +439,13 @@ def test_extract_symlink_overwrite(tmp_path):
 @pytest.mark.files
 def test_py7zr_extract_corrupted(tmp_path):
     with pytest.raises(Bad7zFile):
-        archive = py7zr.SevenZipFile(str(testdata_path.joinpath('crc_corrupted.7z')), 'r')
-        archive.extract(path=tmp_path)
-        archive.close()
+        with py7zr.SevenZipFile(FILES['crc_corrupted.7z'], 'r') as archive:
+            archive.extract(path=tmp_path)
 
 
 @pytest.mark.files
-def test_extract_lzma2delta(tmp_path):
-    with py7zr.SevenZipFile(testdata_path.joinpath('lzma2delta_1.7z').open('rb')) as archive:
+def test_extract_lzma2delta(tmp_path, archive_bytes):
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('lzma2delta_1.7z'))) as archive:
         archive.extractall(path=tmp_path)
 
 
@@ -435,30 +466,30 @@ def test_decompress_small_files(tmp_path):
 
 
 @pytest.mark.files
-def test_extract_lzma_bcj_x86(tmp_path):
-    with py7zr.SevenZipFile(testdata_path.joinpath('lzma_bcj_x86.7z').open(mode='rb')) as ar:
+def test_extract_lzma_bcj_x86(tmp_path, archive_bytes):
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('lzma_bcj_x86.7z'))) as ar:
         _dict = ar.readall()
 
 
 @pytest.mark.files
-def test_extract_lzma_bcj_arm(tmp_path):
-    with py7zr.SevenZipFile(testdata_path.joinpath('lzma_bcj_arm.7z').open(mode='rb')) as ar:
+def test_extract_lzma_bcj_arm(tmp_path, archive_bytes):
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('lzma_bcj_arm.7z'))) as ar:
         ar.extractall(tmp_path)
 
 
 @pytest.mark.files
-def test_extract_lzma_bcj_armt(tmp_path):
-    with py7zr.SevenZipFile(testdata_path.joinpath('lzma_bcj_armt.7z').open(mode='rb')) as ar:
+def test_extract_lzma_bcj_armt(tmp_path, archive_bytes):
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('lzma_bcj_armt.7z'))) as ar:
         ar.extractall(tmp_path)
 
 
 @pytest.mark.files
-def test_extract_lzma_bcj_ppc(tmp_path):
-    with py7zr.SevenZipFile(testdata_path.joinpath('lzma_bcj_ppc.7z').open(mode='rb')) as ar:
+def test_extract_lzma_bcj_ppc(tmp_path, archive_bytes):
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('lzma_bcj_ppc.7z'))) as ar:
         ar.extractall(tmp_path)
 
 
 @pytest.mark.files
-def test_extract_lzma_bcj_sparc(tmp_path):
-    with py7zr.SevenZipFile(testdata_path.joinpath('lzma_bcj_sparc.7z').open(mode='rb')) as ar:
+def test_extract_lzma_bcj_sparc(tmp_path, archive_bytes):
+    with py7zr.SevenZipFile(io.BytesIO(archive_bytes('lzma_bcj_sparc.7z'))) as ar:
         ar.extractall(tmp_path)
@@ -1,4 +1,5 @@
 import binascii
+import concurrent.futures
 import ctypes
 import datetime
 import hashlib
@@ -17,6 +18,8 @@ import py7zr.helpers
 import py7zr.properties
 from py7zr.py7zr import FILE_ATTRIBUTE_UNIX_EXTENSION
 
+from . import file_sha256
+
 if sys.version_info < (3, 6):
     import pathlib2 as pathlib
 else:
@@ -640,3 +643,15 @@ def test_bcj_decode(tmp_path):
             m.update(filter.decompress(data))
             data = f.read(8192)
         assert m.digest() == binascii.unhexlify('5ae0726746e2ccdad8f511ecfcf5f79df4533b83f86b1877cebc07f14a4e9b6a')
+
+
+@pytest.mark.unit
+def test_file_sha256_chunked(monkeypatch):
+    # force the readinto() loop used on interpreters without hashlib.file_digest
+    monkeypatch.delattr(hashlib, 'file_digest', raising=False)
+    targets = [os.path.join(testdata_path, name) for name in ('mblock_1.7z', 'lzma2bcj.7z', 'empty.7z')] * 4
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        digests = list(executor.map(file_sha256, targets))
+    for target, digest in zip(targets, digests):
+        with open(target, 'rb') as f:
+            assert digest == hashlib.sha256(f.read()).digest(), "Fails digest for %s" % target